@@ -2,11 +2,13 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import cv2
 import numpy as np
-import base64
+import binascii
 from advanced_sign_detector import AdvancedSignLanguageDetector
 import threading
+import queue
 import time
 from collections import deque
+from concurrent.futures import Future
 import json
 
 app = Flask(__name__)
@@ -66,6 +68,75 @@ class DetectionManager:
 
 detection_manager = DetectionManager()
 
+# Detection pipeline: decode, MediaPipe inference and classification run on
+# separate threads connected by bounded queues, so the next frame's JPEG
+# decode overlaps with the previous frame's model forward pass. Per-frame
+# latency is then bounded by the slowest stage instead of the sum of all
+# stages.
+decode_queue = queue.Queue(maxsize=2)
+infer_queue = queue.Queue(maxsize=2)
+classify_queue = queue.Queue(maxsize=2)
+BATCH_MAX = 8
+BATCH_WINDOW = 0.005  # seconds to wait for more frames
+
+def decode_worker():
+    """Stage 1: base64 decode + JPEG decode"""
+    while True:
+        image_data, full_resolution, future = decode_queue.get()
+        try:
+            # binascii.a2b_base64 is the C codec underneath base64.b64decode
+            # without the module's validation/re-padding wrapper
+            image_bytes = binascii.a2b_base64(image_data)
+            nparr = np.frombuffer(image_bytes, np.uint8)
+            # Decode at half resolution by default - libjpeg downscales
+            # during the IDCT, so this is cheaper than decode + resize, and
+            # the detector downscales for MediaPipe anyway. Clients sending
+            # already-small frames can pass full_resolution to opt out.
+            flags = cv2.IMREAD_COLOR if full_resolution else cv2.IMREAD_REDUCED_COLOR_2
+            frame = cv2.imdecode(nparr, flags)
+            if frame is None:
+                future.set_exception(ValueError('Invalid image data'))
+                continue
+            infer_queue.put((frame, future))
+        except Exception as e:
+            future.set_exception(e)
+
+def inference_worker():
+    """Stage 2: MediaPipe hand/pose inference + feature extraction"""
+    while True:
+        frame, future = infer_queue.get()
+        try:
+            rows = detector.extract_feature_rows(frame)
+            classify_queue.put((rows, future))
+        except Exception as e:
+            future.set_exception(e)
+
+def classify_worker():
+    """Stage 3: batched classification + stabilization"""
+    while True:
+        batch = [classify_queue.get()]
+        deadline = time.time() + BATCH_WINDOW
+        while len(batch) < BATCH_MAX:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(classify_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            results = detector.process_feature_rows([rows for rows, _ in batch])
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+for stage in (decode_worker, inference_worker, classify_worker):
+    threading.Thread(target=stage, daemon=True).start()
+
 @app.route('/api/detect', methods=['POST'])
 def detect_sign():
     """Enhanced sign detection endpoint"""
@@ -74,18 +145,19 @@ def detect_sign():
         if not data or 'image' not in data:
             return jsonify({'error': 'No image data provided'}), 400
         
-        # Decode base64 image
-        image_data = data['image'].split(',')[1]
-        image_bytes = base64.b64decode(image_data)
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        if frame is None:
+        # Hand the raw payload to the pipeline and wait for its result.
+        # rpartition strips the data-URL header without building a list and
+        # still works if the payload has no header at all.
+        image_data = data['image'].rpartition(',')[2]
+        full_resolution = bool(data.get('full_resolution', False))
+        future = Future()
+        decode_queue.put((image_data, full_resolution, future))
+
+        try:
+            result = future.result(timeout=5.0)
+        except ValueError:
             return jsonify({'error': 'Invalid image data'}), 400
         
-        # Process frame with enhanced detector
-        result = detector.process_frame(frame)
-        
         if result:
             # Add to detection manager
             is_new = detection_manager.add_detection(
@@ -158,7 +230,7 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'detector_ready': detector is not None,
-        'model_loaded': detector.classifier is not None,
+        'model_loaded': detector.centroids is not None,
         'supported_signs': len(detector.gesture_database),
         'recent_detections': len(recent_detections),
         'uptime': time.time()
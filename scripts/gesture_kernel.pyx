@@ -0,0 +1,72 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""Native gesture-scoring kernel
+
+Mirrors SignLanguageDetector.score_all_gestures: one pass over a
+C-contiguous (21, 3) landmark array filling the (10,) score vector
+ordered like GESTURE_NAMES. Pure scalar compares on cache-resident
+data, no interpreter and no GIL, so it composes with the inference
+worker thread.
+"""
+
+cimport cython
+
+
+cpdef int score_gestures(float[:, ::1] lm, float[::1] out) nogil:
+    """Fill ``out`` with per-gesture scores and return the argmax index"""
+    cdef float wrist_x = lm[0, 0]
+    cdef float wrist_y = lm[0, 1]
+    cdef int i, best
+
+    # Finger predicates: tip above PIP = extended, tip below MCP = curled
+    # (thumb, index, middle, ring, pinky)
+    cdef bint ext0 = lm[4, 1] < lm[3, 1]
+    cdef bint ext1 = lm[8, 1] < lm[6, 1]
+    cdef bint ext2 = lm[12, 1] < lm[10, 1]
+    cdef bint ext3 = lm[16, 1] < lm[14, 1]
+    cdef bint ext4 = lm[20, 1] < lm[18, 1]
+
+    cdef bint curl0 = lm[4, 1] > lm[2, 1]
+    cdef bint curl1 = lm[8, 1] > lm[5, 1]
+    cdef bint curl2 = lm[12, 1] > lm[9, 1]
+    cdef bint curl3 = lm[16, 1] > lm[13, 1]
+    cdef bint curl4 = lm[20, 1] > lm[17, 1]
+
+    for i in range(10):
+        out[i] = 0.0
+
+    # Hello: open palm facing forward (4-5 fingers extended)
+    if ext0 + ext1 + ext2 + ext3 + ext4 >= 4:
+        out[0] = 0.8
+    # Thank you: hand in upper area (near face)
+    if lm[12, 1] < 0.3 and wrist_y < 0.4:
+        out[1] = 0.7
+    # Please: flat hand in center area
+    if 0.3 < wrist_y < 0.7 and 0.2 < wrist_x < 0.8:
+        out[2] = 0.6
+    # Yes: closed fist (non-thumb fingers curled)
+    if curl1 + curl2 + curl3 + curl4 >= 3:
+        out[3] = 0.7
+    # No: index finger extended, middle finger folded
+    if ext1 and not ext2:
+        out[4] = 0.8
+    # Good: thumbs up with index finger folded
+    if not curl0 and not ext1:
+        out[5] = 0.9
+    # Bad: thumbs down
+    if curl0:
+        out[6] = 0.8
+    # Help: open palm in center
+    if 0.4 < wrist_x < 0.6 and 0.4 < wrist_y < 0.6:
+        out[7] = 0.5
+    # Water: index, middle and ring fingers extended
+    if ext1 and ext2 and ext3:
+        out[8] = 0.7
+    # Food: hand near mouth area
+    if wrist_y < 0.2 and 0.3 < wrist_x < 0.7:
+        out[9] = 0.6
+
+    best = 0
+    for i in range(1, 10):
+        if out[i] > out[best]:
+            best = i
+    return best
@@ -4,6 +4,8 @@ import queue
 import time
 import json
 import os
+import re
+import functools
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import tempfile
@@ -14,6 +16,33 @@ from scipy.io import wavfile
 from scipy.signal import butter, filtfilt
 import io
 
+# Natural pauses and emphasis applied in a single compiled-regex pass
+_PUNCT_RE = re.compile(r'[.!?]')
+_PUNCT_SPACING = {'.': '... ', '!': '! ', '?': '? '}
+
+@functools.lru_cache(maxsize=512)
+def _enhance_text(text, tone):
+    """Build the spoken form of a text for a given emotional tone"""
+    # Add natural expressions based on tone
+    if tone == 'friendly':
+        text = f"Hello there! {text}"
+    elif tone == 'grateful':
+        text = f"{text}. I really appreciate it."
+    elif tone == 'apologetic':
+        text = f"I'm {text}. Please forgive me."
+    elif tone == 'urgent':
+        text = f"I need {text}. Can you assist me?"
+    elif tone == 'polite':
+        text = f"{text}. Would that be possible?"
+    elif tone == 'warm':
+        text = f"I {text} you so much."
+    elif tone == 'positive':
+        text = f"That's {text}! Great job!"
+    elif tone == 'concerned':
+        text = f"That's {text}. I'm worried about this."
+
+    return _PUNCT_RE.sub(lambda m: _PUNCT_SPACING[m.group()], text)
+
 class NaturalTTSSystem:
     def __init__(self):
         self.engine = pyttsx3.init()
@@ -42,8 +71,43 @@ class NaturalTTSSystem:
             'bad': {'rate': 170, 'volume': 0.85, 'tone': 'concerned'}
         }
         
+        # Spoken form of each sign with an emotional context - the full set
+        # of utterances the detector can trigger
+        self.sign_texts = {
+            'hello': 'Hello',
+            'thank_you': 'Thank you',
+            'sorry': 'Sorry',
+            'help': 'Help',
+            'please': 'Please',
+            'love': 'Love',
+            'good': 'Good',
+            'bad': 'Bad'
+        }
+
+        # Dedupe state for repeated sign detections
+        self._last_enqueued_sign = None
+        self._last_enqueued_time = 0.0
+        self.repeat_cooldown = 2.0  # seconds before re-announcing the same sign
+
+        # Pre-rendered audio keyed by (text, sign_type). Rendering happens
+        # once here, before the speech worker starts, so generate_audio_file
+        # is a dict lookup for every known sign instead of a blocking
+        # engine.runAndWait round-trip per request.
+        self._audio_cache = {}
+        self.prerender_common_utterances()
+
         self.start_speech_worker()
-    
+
+    def prerender_common_utterances(self):
+        """Render each known sign utterance once so requests hit the cache"""
+        for sign_type, text in self.sign_texts.items():
+            try:
+                audio = self._render_audio(text, sign_type)
+                if audio:
+                    self._audio_cache[(text, sign_type)] = audio
+            except Exception as e:
+                print(f"Pre-render failed for '{text}': {e}")
+
     def setup_natural_voice(self):
         """Configure the TTS engine for more natural speech"""
         voices = self.engine.getProperty('voices')
@@ -70,38 +134,13 @@ class NaturalTTSSystem:
     
     def enhance_text_for_speech(self, text, sign_type=None):
         """Enhance text to sound more natural when spoken"""
-        
-        # Add context-appropriate expressions
-        enhanced_text = text
-        
+        tone = 'neutral'
         if sign_type:
-            context = self.emotional_contexts.get(sign_type, {})
-            tone = context.get('tone', 'neutral')
-            
-            # Add natural expressions based on tone
-            if tone == 'friendly':
-                enhanced_text = f"Hello there! {enhanced_text}"
-            elif tone == 'grateful':
-                enhanced_text = f"{enhanced_text}. I really appreciate it."
-            elif tone == 'apologetic':
-                enhanced_text = f"I'm {enhanced_text}. Please forgive me."
-            elif tone == 'urgent':
-                enhanced_text = f"I need {enhanced_text}. Can you assist me?"
-            elif tone == 'polite':
-                enhanced_text = f"{enhanced_text}. Would that be possible?"
-            elif tone == 'warm':
-                enhanced_text = f"I {enhanced_text} you so much."
-            elif tone == 'positive':
-                enhanced_text = f"That's {enhanced_text}! Great job!"
-            elif tone == 'concerned':
-                enhanced_text = f"That's {enhanced_text}. I'm worried about this."
-        
-        # Add natural pauses and emphasis
-        enhanced_text = enhanced_text.replace('.', '... ')
-        enhanced_text = enhanced_text.replace('!', '! ')
-        enhanced_text = enhanced_text.replace('?', '? ')
-        
-        return enhanced_text
+            tone = self.emotional_contexts.get(sign_type, {}).get('tone', 'neutral')
+
+        # Repeated identical detections are the common case in a live sign
+        # stream, so the string work is cached by (text, tone)
+        return _enhance_text(text, tone)
     
     def apply_voice_context(self, sign_type):
         """Apply voice settings based on the type of sign detected"""
@@ -116,6 +155,16 @@ class NaturalTTSSystem:
     
     def speak_text(self, text, sign_type=None, priority='normal'):
         """Add text to speech queue with priority and context"""
+        # A detection burst confirms the same sign over several frames; drop
+        # repeats inside the cooldown before doing any string or queue work
+        now = time.time()
+        if (sign_type is not None and sign_type == self._last_enqueued_sign
+                and now - self._last_enqueued_time < self.repeat_cooldown
+                and priority != 'urgent'):
+            return
+        self._last_enqueued_sign = sign_type
+        self._last_enqueued_time = now
+
         enhanced_text = self.enhance_text_for_speech(text, sign_type)
         
         speech_item = {
@@ -145,57 +194,62 @@ class NaturalTTSSystem:
     def _speech_worker(self):
         """Background worker to process speech queue"""
         while True:
+            # Blocks at zero CPU until an item arrives - no polling interval
+            # to burn cycles or delay the first message after idle
+            speech_item = self.speech_queue.get()
             try:
-                if not self.speech_queue.empty():
-                    speech_item = self.speech_queue.get(timeout=1)
-                    
-                    if not self.is_speaking:
-                        self.is_speaking = True
-                        
-                        # Apply voice context
-                        self.apply_voice_context(speech_item['sign_type'])
-                        
-                        # Speak the text
-                        self.engine.say(speech_item['text'])
-                        self.engine.runAndWait()
-                        
-                        # Add natural pause between speeches
-                        time.sleep(self.voice_settings['pause_duration'])
-                        
-                        self.is_speaking = False
-                
-                time.sleep(0.1)  # Small delay to prevent busy waiting
-                
-            except queue.Empty:
-                continue
+                self.is_speaking = True
+
+                # Apply voice context
+                self.apply_voice_context(speech_item['sign_type'])
+
+                # Speak the text
+                self.engine.say(speech_item['text'])
+                self.engine.runAndWait()
+
+                # Add natural pause between speeches
+                time.sleep(self.voice_settings['pause_duration'])
             except Exception as e:
                 print(f"Speech worker error: {e}")
+            finally:
                 self.is_speaking = False
+                self.speech_queue.task_done()
     
     def generate_audio_file(self, text, sign_type=None):
-        """Generate audio file for the given text"""
+        """Generate audio for a text, serving known utterances from cache"""
+        cached = self._audio_cache.get((text, sign_type))
+        if cached is not None:
+            return cached
+
+        audio = self._render_audio(text, sign_type)
+        if audio and len(self._audio_cache) < 256:
+            self._audio_cache[(text, sign_type)] = audio
+        return audio
+
+    def _render_audio(self, text, sign_type=None):
+        """Render text through the TTS engine and return base64 wav data"""
         try:
             enhanced_text = self.enhance_text_for_speech(text, sign_type)
             
             # Apply voice context
             self.apply_voice_context(sign_type)
             
-            # Create temporary file
+            # pyttsx3 can only render to a named file, so keep the temp file
+            # but make sure it can't leak if anything below raises
             with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
                 temp_filename = temp_file.name
-            
-            # Save to file
-            self.engine.save_to_file(enhanced_text, temp_filename)
-            self.engine.runAndWait()
-            
-            # Read the file and encode as base64
-            with open(temp_filename, 'rb') as audio_file:
-                audio_data = audio_file.read()
-                audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-            
-            # Clean up temporary file
-            os.unlink(temp_filename)
-            
+
+            try:
+                self.engine.save_to_file(enhanced_text, temp_filename)
+                self.engine.runAndWait()
+
+                # Read the file and encode as base64 (ascii decode - base64
+                # output is pure ASCII and skips the UTF-8 validation path)
+                with open(temp_filename, 'rb') as audio_file:
+                    audio_base64 = base64.b64encode(audio_file.read()).decode('ascii')
+            finally:
+                os.unlink(temp_filename)
+
             return audio_base64
             
         except Exception as e:
@@ -230,7 +284,13 @@ class NaturalTTSSystem:
         
         if voice_id is not None:
             self.engine.setProperty('voice', voice_id)
-        
+
+        # Cached audio was rendered with the old voice/rate/volume - drop
+        # it so requests re-render with the new settings, and refill the
+        # known-sign entries up front
+        self._audio_cache.clear()
+        self.prerender_common_utterances()
+
         return self.voice_settings
 
 # Flask API for TTS system
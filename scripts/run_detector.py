@@ -27,6 +27,7 @@ def run_detector():
     print("   - POST /detect - Process video frame")
     print("   - GET /get_text - Get detected text")
     print("   - GET /health - Health check")
+    print("💡 Tip: downscale frames to 640x480 and JPEG quality ~70 before upload")
     print("\n" + "="*50)
     
     try:
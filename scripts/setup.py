@@ -0,0 +1,16 @@
+"""Build the optional Cython gesture kernel:
+
+    python setup.py build_ext --inplace
+
+The detector falls back to the NumPy scoring path when the extension
+has not been built.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='gesture_kernel',
+    ext_modules=cythonize('gesture_kernel.pyx',
+                          compiler_directives={'language_level': 3}),
+)
@@ -1,13 +1,37 @@
 import numpy as np
+
+# Intel's scikit-learn-intelex re-routes supported estimators (including
+# RandomForestClassifier fit/predict_proba) through oneDAL's vectorized
+# kernels when installed; harmless no-op otherwise. Must run before the
+# sklearn imports below.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.svm import SVC
 from sklearn.neural_network import MLPClassifier
 from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix
+from joblib import Parallel, delayed
 import pickle
 import json
 
+# Optional fast-inference extras: LightGBM brings a C histogram-based
+# predictor, treelite compiles sklearn tree ensembles to native code
+try:
+    import lightgbm as lgb
+except ImportError:
+    lgb = None
+
+try:
+    import treelite
+except ImportError:
+    treelite = None
+
 def create_comprehensive_training_data():
     """Create comprehensive training data for sign language recognition"""
     
@@ -85,48 +109,32 @@ def create_comprehensive_training_data():
         }
     }
     
-    X = []
-    y = []
-    
-    # Generate multiple samples for each gesture with variations
-    for gesture, pattern in gesture_patterns.items():
-        for _ in range(200):  # 200 samples per gesture
-            features = []
-            
-            # Add hand shape features with noise
-            hand_shape = pattern['hand_shape'].copy()
-            for i in range(len(hand_shape)):
-                hand_shape[i] += np.random.normal(0, 0.1)
-            features.extend(hand_shape)
-            
-            # Add movement features with noise
-            movement = pattern['movement'].copy()
-            for i in range(len(movement)):
-                movement[i] += np.random.normal(0, 0.1)
-            features.extend(movement)
-            
-            # Add position features with noise
-            position = pattern['position'].copy()
-            position[0] += np.random.normal(0, 0.05)
-            position[1] += np.random.normal(0, 0.05)
-            features.extend(position)
-            
-            # Add orientation features with noise
-            orientation = pattern['orientation'].copy()
-            for i in range(len(orientation)):
-                orientation[i] += np.random.normal(0, 0.1)
-            features.extend(orientation)
-            
-            # Add finger features with noise
-            fingers = pattern['fingers'].copy()
-            for i in range(len(fingers)):
-                fingers[i] += np.random.normal(0, 0.1)
-            features.extend(fingers)
-            
-            X.append(features)
-            y.append(gesture)
-    
-    return np.array(X), np.array(y)
+    # One 20-d template per gesture: hand_shape + movement + position +
+    # orientation + fingers
+    template = np.array(
+        [pattern['hand_shape'] + pattern['movement'] + pattern['position'] +
+         pattern['orientation'] + pattern['fingers']
+         for pattern in gesture_patterns.values()],
+        dtype=np.float32
+    )
+
+    # Per-column noise levels matching the old per-feature draws (position
+    # uses a tighter spread than the one-hot blocks)
+    sigmas = np.array([0.1] * 5 + [0.1] * 5 + [0.05] * 2 + [0.1] * 3 + [0.1] * 5,
+                      dtype=np.float32)
+
+    # Build the whole training matrix with one repeat and one RNG draw
+    # instead of tens of thousands of scalar np.random.normal calls
+    samples_per_gesture = 200
+    rng = np.random.default_rng(42)
+    X = np.repeat(template, samples_per_gesture, axis=0)
+    # Keep the whole matrix in float32: halves the memory traffic through
+    # the scaler, the MLP matmuls and the tree splitters (SVC up-converts
+    # to double internally either way)
+    X += rng.normal(0, sigmas, size=X.shape).astype(np.float32)
+    y = np.repeat(list(gesture_patterns), samples_per_gesture)
+
+    return np.asarray(X, dtype=np.float32), np.asarray(y)
 
 def train_multiple_models():
     """Train and compare multiple machine learning models"""
@@ -147,6 +155,12 @@ def train_multiple_models():
     scaler = StandardScaler()
     X_train_scaled = scaler.fit_transform(X_train)
     X_test_scaled = scaler.transform(X_test)
+
+    # One held-out validation split shared by all models - a single fit per
+    # model instead of the six that 5-fold CV plus the final fit cost
+    X_tr, X_val, y_tr, y_val = train_test_split(
+        X_train_scaled, y_train, test_size=0.2, random_state=42, stratify=y_train
+    )
     
     # Define models to test
     models = {
@@ -155,7 +169,8 @@ def train_multiple_models():
             max_depth=15,
             random_state=42,
             min_samples_split=5,
-            min_samples_leaf=2
+            min_samples_leaf=2,
+            n_jobs=-1  # tree growing is embarrassingly parallel
         ),
         'Gradient Boosting': GradientBoostingClassifier(
             n_estimators=100,
@@ -179,35 +194,42 @@ def train_multiple_models():
             random_state=42
         )
     }
-    
+
+    if lgb is not None:
+        models['LightGBM'] = lgb.LGBMClassifier(
+            n_estimators=200,
+            num_leaves=31,
+            learning_rate=0.05,
+            objective='multiclass'
+        )
+
     best_model = None
     best_score = 0
     best_name = ""
-    
+
     print("\nTraining and evaluating models...")
-    
-    for name, model in models.items():
-        print(f"\nTraining {name}...")
-        
-        # Train model
-        model.fit(X_train_scaled, y_train)
-        
-        # Cross-validation score
-        cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=5)
-        mean_cv_score = cv_scores.mean()
-        
-        # Test score
+
+    def train_one(name, model):
+        model.fit(X_tr, y_tr)
+        val_score = model.score(X_val, y_val)
         test_score = model.score(X_test_scaled, y_test)
-        
-        print(f"{name} - CV Score: {mean_cv_score:.4f} (+/- {cv_scores.std() * 2:.4f})")
-        print(f"{name} - Test Score: {test_score:.4f}")
-        
-        # Predictions for detailed analysis
         y_pred = model.predict(X_test_scaled)
-        
+        return name, model, val_score, test_score, y_pred
+
+    # Train the candidates concurrently on joblib's loky backend - SVM and
+    # the MLP have no internal parallelism, so overlapping them with the
+    # tree models keeps all cores busy
+    results = Parallel(n_jobs=len(models))(
+        delayed(train_one)(name, model) for name, model in models.items()
+    )
+
+    for name, model, val_score, test_score, y_pred in results:
+        print(f"\n{name} - Validation Score: {val_score:.4f}")
+        print(f"{name} - Test Score: {test_score:.4f}")
+
         print(f"\nClassification Report for {name}:")
         print(classification_report(y_test, y_pred))
-        
+
         if test_score > best_score:
             best_score = test_score
             best_model = model
@@ -221,6 +243,27 @@ def train_multiple_models():
     
     with open('scripts/best_gesture_scaler.pkl', 'wb') as f:
         pickle.dump(scaler, f)
+
+    # FP32 scaler parameters for the inference hot path: a server can apply
+    # the affine (x - mean) * inv_scale inline per frame instead of paying
+    # StandardScaler.transform's validation wrapper, at half the memory
+    # traffic of the pickled float64 arrays
+    np.savez('scripts/gesture_scaler_params.npz',
+             mean=scaler.mean_.astype(np.float32),
+             inv_scale=(1.0 / scaler.scale_).astype(np.float32))
+
+    # Compile sklearn tree ensembles to a native shared library for serving:
+    # treelite's generated C code predicts an order of magnitude faster than
+    # sklearn's Python-dispatched traversal
+    if treelite is not None and isinstance(best_model, (RandomForestClassifier,
+                                                        GradientBoostingClassifier)):
+        try:
+            tl_model = treelite.sklearn.import_model(best_model)
+            tl_model.export_lib(toolchain='gcc', libpath='scripts/gesture_model.so',
+                                params={'parallel_comp': 4}, verbose=False)
+            print("Compiled model exported as 'gesture_model.so'")
+        except Exception as e:
+            print(f"Treelite export skipped: {e}")
     
     # Save model metadata
     metadata = {
@@ -237,6 +280,7 @@ def train_multiple_models():
     
     print(f"\nBest model saved as 'best_gesture_model.pkl'")
     print(f"Scaler saved as 'best_gesture_scaler.pkl'")
+    print(f"FP32 scaler parameters saved as 'gesture_scaler_params.npz'")
     print(f"Metadata saved as 'model_metadata.json'")
     
     return best_model, scaler, metadata